@@ -10,19 +10,33 @@ Dashboard-based CPU Scheduling Simulator supporting:
 Built using:
     - customtkinter (modern GUI)
     - matplotlib (Gantt chart visualization)
+    - numpy (metrics computation)
+    - numba (optional, compiled Round Robin loop)
 
 Run:
     python cpu_scheduler_dashboard.py
 """
 
-import math
+import heapq
+import multiprocessing
+import threading
 import tkinter as tk
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from tkinter import ttk, messagebox
 
 import customtkinter as ctk
+import numpy as np
 from matplotlib.figure import Figure
+from matplotlib.ticker import MaxNLocator
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; Round Robin falls back to pure Python
+    njit = None
+
 
 # ------------------------------------------------------------
 # Data Model
@@ -36,6 +50,8 @@ class Process:
         burst: CPU burst time (int)
         priority: Smaller value = higher priority (int)
     """
+    __slots__ = ("pid", "arrival", "burst", "priority")
+
     def __init__(self, pid, arrival, burst, priority=0):
         self.pid = pid
         self.arrival = arrival
@@ -43,199 +59,505 @@ class Process:
         self.priority = priority
 
 
+# Process attributes are stored as int32; Gantt times stay int64 since
+# they accumulate bursts and can outgrow a single attribute's range
+PROCESS_DTYPE = np.int32
+PROCESS_MAX = int(np.iinfo(PROCESS_DTYPE).max)
+PROCESS_MIN = int(np.iinfo(PROCESS_DTYPE).min)
+
+
+def _process_arrays(processes):
+    """
+    Struct-of-arrays view of processes: (arrival, burst, priority) as
+    PROCESS_DTYPE arrays in input order. run_scheduler builds it once
+    and shares it between the simulator and compute_metrics.
+    """
+    n = len(processes)
+    arrival = np.fromiter((p.arrival for p in processes), dtype=PROCESS_DTYPE, count=n)
+    burst = np.fromiter((p.burst for p in processes), dtype=PROCESS_DTYPE, count=n)
+    priority = np.fromiter((p.priority for p in processes), dtype=PROCESS_DTYPE, count=n)
+    return arrival, burst, priority
+
+
 # ------------------------------------------------------------
-# Scheduling Algorithms
+# Gantt Representation
 # ------------------------------------------------------------
 
-def simulate_fcfs(processes):
-    """First Come First Serve (Non-preemptive)."""
-    processes = sorted(processes, key=lambda p: p.arrival)
-    gantt = []
-    time = 0
+# One record per block, in time order. pid_idx is the block's position
+# in the scheduled processes list, or IDLE_IDX for idle gaps.
+GANTT_DTYPE = np.dtype([("pid_idx", np.int32),
+                        ("start", np.int64),
+                        ("end", np.int64)])
 
-    for p in processes:
-        if time < p.arrival:
-            gantt.append({"pid": "IDLE", "start": time, "end": p.arrival})
-            time = p.arrival
+IDLE_IDX = -1
+
+
+def _append_block(idxs, starts, ends, idx, start, end):
+    """Append a Gantt block, extending the previous one if it is contiguous."""
+    if idxs and idxs[-1] == idx and ends[-1] == start:
+        ends[-1] = end
+    else:
+        idxs.append(idx)
+        starts.append(start)
+        ends.append(end)
 
-        start = time
-        end = time + p.burst
-        gantt.append({"pid": p.pid, "start": start, "end": end})
-        time = end
 
+def _make_gantt(idxs, starts, ends):
+    """Pack parallel block sequences into a GANTT_DTYPE array."""
+    gantt = np.empty(len(idxs), dtype=GANTT_DTYPE)
+    gantt["pid_idx"] = idxs
+    gantt["start"] = starts
+    gantt["end"] = ends
     return gantt
 
 
-def simulate_sjf_np(processes):
-    """Shortest Job First (Non-preemptive)."""
-    remaining = sorted(processes, key=lambda p: p.arrival)
-    gantt = []
+def _validate_gantt(starts, ends):
+    """Check that no block has negative width and no two blocks overlap."""
+    assert (ends >= starts).all(), "Gantt block ends before it starts"
+    assert (starts[1:] >= ends[:-1]).all(), "Gantt blocks overlap"
+
+
+def gantt_to_broken_barh(gantt):
+    """
+    Group Gantt blocks by pid_idx into lists of (start, width) pairs,
+    the shape ax.broken_barh expects. Keys keep first-appearance order.
+    """
+    bars = {}
+    for idx, start, end in gantt.tolist():
+        bars.setdefault(idx, []).append((start, end - start))
+    return bars
+
+
+# ------------------------------------------------------------
+# Scheduling Algorithms
+# ------------------------------------------------------------
+
+def _arrival_order(processes):
+    """
+    Indices into processes, ordered by arrival (stable). Every simulator
+    accepts this as order= and only computes it when it is omitted;
+    any integer sequence works (list, tuple or 1-D ndarray, such as
+    np.argsort(arrival, kind="stable")).
+    """
+    return sorted(range(len(processes)), key=lambda i: processes[i].arrival)
+
+
+def simulate_fcfs(processes, order=None, arrays=None):
+    """
+    First Come First Serve (Non-preemptive).
+
+    start[i] = max(end[i-1], arrival[i]) unrolls to
+    max(0, max over j <= i of (arrival[j] - done[j])) + done[i], where
+    done is the burst total before i, so the whole schedule is a
+    cumulative max; idle gaps are then interleaved with array operations.
+
+    Returns (gantt, None); see simulate_rr for the second element.
+    """
+    if arrays is None:
+        arrays = _process_arrays(processes)
+
+    if order is None:
+        order = _arrival_order(processes)
+    n = len(order)
+
+    # An ndarray index, since a tuple would index multiple dimensions
+    sel = np.asarray(order, dtype=np.intp)
+    arrival = arrays[0][sel]
+    burst = arrays[1][sel]
+
+    # Accumulate in int64: the int32 bursts can sum past int32 range
+    done = np.cumsum(burst, dtype=np.int64) - burst
+    starts = np.maximum(np.maximum.accumulate(arrival - done), 0) + done
+    ends = starts + burst
+
+    prev_end = np.concatenate(([0], ends[:-1]))
+    gap = starts > prev_end
+
+    # Each process moves right by the number of idle blocks before it
+    slot = np.arange(n) + np.cumsum(gap)
+    idle = slot[gap] - 1
+    m = n + int(gap.sum())
+
+    gantt = np.empty(m, dtype=GANTT_DTYPE)
+    gantt["pid_idx"][idle] = IDLE_IDX
+    gantt["pid_idx"][slot] = order
+    gantt["start"][slot] = starts
+    gantt["end"][slot] = ends
+    gantt["start"][idle] = prev_end[gap]
+    gantt["end"][idle] = starts[gap]
+
+    return gantt, None
+
+
+def _simulate_np_heap(processes, field, order=None, arrays=None):
+    """
+    Shared non-preemptive loop for SJF and Priority.
+
+    Processes are sorted by arrival once and consumed through an index
+    cursor; arrived processes go into a min-heap ordered by
+    arrays[field], so each scheduling decision costs O(log n) instead
+    of a full rescan.
+
+    Returns (gantt, None); see simulate_rr for the second element.
+    """
+    if arrays is None:
+        arrays = _process_arrays(processes)
+
+    if order is None:
+        order = _arrival_order(processes)
+    keys = arrays[field].tolist()
+    bursts = arrays[1].tolist()
+    arrivals = arrays[0][np.asarray(order, dtype=np.intp)].tolist()
+    idxs, starts, ends = [], [], []
     time = 0
 
-    while remaining:
-        ready = [p for p in remaining if p.arrival <= time]
+    ready_heap = []
+    k = 0
+    n = len(order)
 
-        if not ready:
-            next_arrival = remaining[0].arrival
-            gantt.append({"pid": "IDLE", "start": time, "end": next_arrival})
+    def add_arrivals(current_time):
+        nonlocal k
+        while k < n and arrivals[k] <= current_time:
+            i = order[k]
+            # i breaks ties in input order, which the stable sort preserves
+            heapq.heappush(ready_heap, (keys[i], arrivals[k], i))
+            k += 1
+
+    add_arrivals(time)
+
+    while ready_heap or k < n:
+        if not ready_heap:
+            next_arrival = arrivals[k]
+            idxs.append(IDLE_IDX)
+            starts.append(time)
+            ends.append(next_arrival)
             time = next_arrival
+            add_arrivals(time)
             continue
 
-        p = min(ready, key=lambda x: x.burst)
-        remaining.remove(p)
+        i = heapq.heappop(ready_heap)[-1]
+        burst = bursts[i]
 
-        start = time
-        end = time + p.burst
-        gantt.append({"pid": p.pid, "start": start, "end": end})
-        time = end
+        idxs.append(i)
+        starts.append(time)
+        ends.append(time + burst)
+        time += burst
+
+        add_arrivals(time)
+
+    return _make_gantt(idxs, starts, ends), None
 
-    return gantt
+
+def simulate_sjf_np(processes, order=None, arrays=None):
+    """Shortest Job First (Non-preemptive)."""
+    return _simulate_np_heap(processes, 1, order, arrays)
 
 
-def simulate_priority_np(processes):
+def simulate_priority_np(processes, order=None, arrays=None):
     """Non-preemptive Priority Scheduling."""
-    remaining = sorted(processes, key=lambda p: p.arrival)
-    gantt = []
-    time = 0
+    return _simulate_np_heap(processes, 2, order, arrays)
 
-    while remaining:
-        ready = [p for p in remaining if p.arrival <= time]
 
-        if not ready:
-            next_arrival = remaining[0].arrival
-            gantt.append({"pid": "IDLE", "start": time, "end": next_arrival})
-            time = next_arrival
-            continue
+def _rr_kernel(arrival, burst, quantum):
+    """
+    Round Robin core over arrival-sorted integer arrays.
+
+    Returns (pid_idx, start, end) arrays of contiguous-coalesced blocks,
+    where pid_idx indexes into the input and -1 marks IDLE, plus each
+    process's first start time in the same input order. The ready
+    queue is a ring buffer of capacity n, since a process is queued at
+    most once at any time. Compiled with numba when it is available.
+    """
+    n = arrival.shape[0]
+    remaining = burst.copy()
 
-        p = min(ready, key=lambda x: (x.priority, x.arrival))
-        remaining.remove(p)
+    max_blocks = n
+    for i in range(n):
+        max_blocks += (burst[i] + quantum - 1) // quantum
+
+    out_pid = np.empty(max_blocks, dtype=np.int64)
+    out_start = np.empty(max_blocks, dtype=np.int64)
+    out_end = np.empty(max_blocks, dtype=np.int64)
+    m = 0
+
+    first = np.full(n, -1, dtype=np.int64)
+
+    ready = np.empty(n, dtype=np.int64)
+    head = 0
+    count = 0
+
+    time = 0
+    idx = 0
+    while idx < n and arrival[idx] <= time:
+        ready[(head + count) % n] = idx
+        count += 1
+        idx += 1
+
+    while count > 0 or idx < n:
+        if count == 0:
+            pid, start, end = -1, time, arrival[idx]
+        else:
+            pid = ready[head]
+            head = (head + 1) % n
+            count -= 1
+            start = time
+            end = time + min(quantum, remaining[pid])
+            remaining[pid] -= end - start
+            if first[pid] < 0:
+                first[pid] = start
+
+        if m > 0 and out_pid[m - 1] == pid and out_end[m - 1] == start:
+            out_end[m - 1] = end
+        else:
+            out_pid[m] = pid
+            out_start[m] = start
+            out_end[m] = end
+            m += 1
 
-        start = time
-        end = time + p.burst
-        gantt.append({"pid": p.pid, "start": start, "end": end})
         time = end
+        while idx < n and arrival[idx] <= time:
+            ready[(head + count) % n] = idx
+            count += 1
+            idx += 1
+
+        if pid >= 0 and remaining[pid] > 0:
+            ready[(head + count) % n] = pid
+            count += 1
+
+    return out_pid[:m], out_start[:m], out_end[:m], first
 
-    return gantt
 
+if njit is not None:
+    _rr_kernel = njit(cache=True)(_rr_kernel)
+    # Compile (or load from the on-disk cache) at import so the first
+    # Run Simulation click does not stall on JIT compilation
+    _rr_kernel(np.zeros(2, dtype=PROCESS_DTYPE), np.ones(2, dtype=PROCESS_DTYPE), 1)
 
-def simulate_rr(processes, quantum):
-    """Round Robin scheduling."""
+
+def simulate_rr(processes, quantum, order=None, arrays=None):
+    """
+    Round Robin scheduling.
+
+    Returns (gantt, first_start), where first_start holds each process's
+    first dispatch time in input order, so compute_metrics can skip
+    scanning every slice for it. The non-preemptive simulators return
+    None in its place.
+    """
     if quantum <= 0:
         raise ValueError("Quantum must be > 0")
 
-    processes = sorted(processes, key=lambda p: p.arrival)
-    gantt = []
+    if order is None:
+        order = _arrival_order(processes)
+    n = len(order)
+
+    if njit is not None and n:
+        if arrays is None:
+            arrays = _process_arrays(processes)
+        sel = np.asarray(order, dtype=np.intp)
+        pos, starts, ends, first = _rr_kernel(arrays[0][sel], arrays[1][sel], quantum)
+
+        # Kernel positions index the arrival order; -1 (IDLE) maps to IDLE_IDX
+        pos_to_idx = np.append(sel, IDLE_IDX)
+        first_start = np.empty(n, dtype=np.int64)
+        first_start[sel] = first
+        return _make_gantt(pos_to_idx[pos], starts, ends), first_start
+
+    arrivals = [processes[i].arrival for i in order]
+    idxs, starts, ends = [], [], []
     time = 0
 
-    remaining = {p.pid: p.burst for p in processes}
-    first_start = {p.pid: None for p in processes}
+    remaining = [p.burst for p in processes]
+    first_start = [None] * len(processes)
 
-    ready = []
-    idx = 0
+    ready = deque()
+    k = 0
 
     def add_arrivals(current_time):
-        nonlocal idx
-        while idx < len(processes) and processes[idx].arrival <= current_time:
-            ready.append(processes[idx])
-            idx += 1
+        nonlocal k
+        while k < n and arrivals[k] <= current_time:
+            ready.append(order[k])
+            k += 1
 
     add_arrivals(time)
 
-    while ready or idx < len(processes):
+    while ready or k < n:
         if not ready:
-            next_arrival = processes[idx].arrival
-            gantt.append({"pid": "IDLE", "start": time, "end": next_arrival})
+            next_arrival = arrivals[k]
+            _append_block(idxs, starts, ends, IDLE_IDX, time, next_arrival)
             time = next_arrival
             add_arrivals(time)
             continue
 
-        p = ready.pop(0)
+        i = ready.popleft()
 
-        if first_start[p.pid] is None:
-            first_start[p.pid] = time
+        if first_start[i] is None:
+            first_start[i] = time
 
-        run_time = min(quantum, remaining[p.pid])
+        run_time = min(quantum, remaining[i])
         start, end = time, time + run_time
-        gantt.append({"pid": p.pid, "start": start, "end": end})
+        _append_block(idxs, starts, ends, i, start, end)
 
         time = end
-        remaining[p.pid] -= run_time
+        remaining[i] -= run_time
 
         add_arrivals(time)
 
-        if remaining[p.pid] > 0:
-            ready.append(p)
+        if remaining[i] > 0:
+            ready.append(i)
 
-    return gantt
+    return _make_gantt(idxs, starts, ends), np.array(first_start, dtype=np.int64)
 
 
 # ------------------------------------------------------------
 # Metrics Calculation
 # ------------------------------------------------------------
 
-def compute_metrics(processes, gantt):
-    """Returns individual process metrics and overall summary."""
+def compute_metrics(processes, gantt, arrays=None, first_start=None):
+    """
+    Returns individual process metrics and overall summary.
 
-    pids = [p.pid for p in processes]
-    arrival = {p.pid: p.arrival for p in processes}
-    burst = {p.pid: p.burst for p in processes}
+    gantt must come from a simulator called with the same processes
+    list, since its pid_idx field indexes into it. Pass the simulator's
+    first_start array, when it has one, to skip recomputing it.
+    """
 
-    completion = {pid: 0 for pid in pids}
-    first_start = {pid: None for pid in pids}
+    if not processes:
+        return {}, {"avg_wt": 0, "avg_tat": 0, "throughput": 0, "total_time": 0}
 
-    for block in gantt:
-        pid = block["pid"]
-        if pid == "IDLE":
-            continue
+    pids = [p.pid for p in processes]
+    n = len(pids)
 
-        start, end = block["start"], block["end"]
-        completion[pid] = max(completion[pid], end)
+    if arrays is None:
+        arrays = _process_arrays(processes)
+    arrival, burst = arrays[0], arrays[1]
 
-        if first_start[pid] is None or start < first_start[pid]:
-            first_start[pid] = start
+    blocks = gantt[gantt["pid_idx"] != IDLE_IDX]
+    idx = blocks["pid_idx"]
 
-    metrics = {}
-    total_wt = total_tat = 0
+    # Scatter-reduce every block onto its process in a single pass
+    completion = np.zeros(n, dtype=np.int64)
+    np.maximum.at(completion, idx, blocks["end"])
 
-    for pid in pids:
-        ct = completion[pid]
-        tat = ct - arrival[pid]
-        wt = tat - burst[pid]
-        rt = (first_start[pid] - arrival[pid]) if first_start[pid] is not None else 0
+    if first_start is None:
+        never = np.iinfo(np.int64).max
+        first_start = np.full(n, never, dtype=np.int64)
+        np.minimum.at(first_start, idx, blocks["start"])
+        rt = np.where(first_start != never, first_start - arrival, 0)
+    else:
+        rt = first_start - arrival
 
-        metrics[pid] = {"CT": ct, "TAT": tat, "WT": wt, "RT": rt}
+    tat = completion - arrival
+    wt = tat - burst
 
-        total_wt += wt
-        total_tat += tat
+    metrics = {}
+    for pid, ct, t, w, r in zip(pids, completion.tolist(), tat.tolist(),
+                                wt.tolist(), rt.tolist()):
+        metrics[pid] = {"CT": ct, "TAT": t, "WT": w, "RT": r}
 
-    total_time = gantt[-1]["end"] if gantt else 0
+    total_time = int(gantt["end"][-1]) if len(gantt) else 0
     summary = {
-        "avg_wt": total_wt / len(pids),
-        "avg_tat": total_tat / len(pids),
-        "throughput": len(pids) / total_time if total_time else 0,
+        "avg_wt": float(wt.sum()) / n,
+        "avg_tat": float(tat.sum()) / n,
+        "throughput": n / total_time if total_time else 0,
         "total_time": total_time
     }
 
     return metrics, summary
 
 
-def run_scheduler(processes, algo, quantum=None):
-    """Main routing function for selecting algorithms."""
+def run_scheduler(processes, algo, quantum=None, presorted=False):
+    """
+    Main routing function for selecting algorithms.
+
+    Pass presorted=True when processes is already ordered by arrival
+    to skip the per-algorithm sort. Results are memoized on the process
+    values, algorithm and quantum, so repeated runs of an unchanged
+    setup share one read-only gantt array; metrics and summary are
+    copied per call so callers may modify them.
+    """
+    key = tuple((p.pid, p.arrival, p.burst, p.priority) for p in processes)
+    if algo != "Round Robin":
+        quantum = None  # only Round Robin reads it; keep it out of the key
+    gantt, metrics, summary = _run_cached(key, algo, quantum, presorted)
+    return gantt, {pid: dict(m) for pid, m in metrics.items()}, dict(summary)
+
+
+@lru_cache(maxsize=32)
+def _run_cached(key, algo, quantum, presorted):
+    """Rebuilds the processes from their value tuples and schedules them."""
+    processes = [Process(*fields) for fields in key]
+    arrays = _process_arrays(processes)
+
+    # Sort once here and hand the order to the simulator
+    if presorted:
+        order = list(range(len(processes)))
+    else:
+        order = _arrival_order(processes)
+
     if algo == "FCFS":
-        gantt = simulate_fcfs(processes)
+        gantt, first_start = simulate_fcfs(processes, order, arrays)
     elif algo == "SJF":
-        gantt = simulate_sjf_np(processes)
+        gantt, first_start = simulate_sjf_np(processes, order, arrays)
     elif algo == "Priority":
-        gantt = simulate_priority_np(processes)
+        gantt, first_start = simulate_priority_np(processes, order, arrays)
     elif algo == "Round Robin":
-        gantt = simulate_rr(processes, quantum)
+        gantt, first_start = simulate_rr(processes, quantum, order, arrays)
     else:
         raise ValueError("Unknown scheduling algorithm.")
 
-    metrics, summary = compute_metrics(processes, gantt)
+    if __debug__:
+        _validate_gantt(gantt["start"], gantt["end"])
+
+    metrics, summary = compute_metrics(processes, gantt, arrays, first_start)
+
+    # Cached and shared between callers, so must not be modified in place
+    gantt.setflags(write=False)
     return gantt, metrics, summary
 
 
+ALGORITHMS = ("FCFS", "SJF", "Priority", "Round Robin")
+
+
+_executor = None
+
+
+def _get_executor():
+    """
+    Shared worker pool for run_all_scheduler, created on first use.
+    Workers are spawned rather than forked so they never inherit the
+    dashboard's threads or Tk state.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=len(ALGORITHMS),
+                                        mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+
+def run_all_scheduler(processes, quantum=None, presorted=False, parallel=False):
+    """
+    Runs every algorithm on the same process set and returns
+    {algo: (gantt, metrics, summary)}. Round Robin is skipped when no
+    quantum is given.
+
+    With parallel=True each algorithm runs in a worker process. Shipping
+    the processes and per-process metrics through pickle costs more than
+    the simulations themselves (about 2x slower than in-process at 1k to
+    300k processes), so in-process is the default and results land in
+    run_scheduler's cache.
+    """
+    algos = [a for a in ALGORITHMS if a != "Round Robin" or quantum is not None]
+
+    if not parallel:
+        return {algo: run_scheduler(processes, algo, quantum, presorted)
+                for algo in algos}
+
+    ex = _get_executor()
+    futures = {algo: ex.submit(run_scheduler, processes, algo, quantum, presorted)
+               for algo in algos}
+    return {algo: f.result() for algo, f in futures.items()}
+
+
 # ------------------------------------------------------------
 # Dashboard UI (CustomTkinter)
 # ------------------------------------------------------------
@@ -247,18 +569,50 @@ ctk.set_default_color_theme("dark-blue")
 class DashboardApp:
     """Main application class for the CPU scheduler dashboard."""
 
+    _styles_configured = False
+
+    _PALETTE = (
+        "#00b894", "#0984e3", "#6c5ce7", "#e84393",
+        "#fdcb6e", "#e17055", "#00cec9", "#e056fd"
+    )
+
     def __init__(self, root):
         self.root = root
         self.root.title("Intelligent CPU Scheduler — Dashboard")
         self.root.geometry("1400x820")
 
         self.processes = []
+        self._processes_version = 0
+        self._sorted_cache = (None, [])
+        self._color_cache = {"IDLE": "#555"}
+        self._busy = False
+        self._run_token = 0
+        self._configure_styles()
         self._build_ui()
 
     # --------------------------------------------------------
     # UI Construction
     # --------------------------------------------------------
 
+    def _configure_styles(self):
+        """Set up the shared ttk theme and Treeview styles once per process."""
+        if DashboardApp._styles_configured:
+            return
+
+        style = ttk.Style()
+
+        style.theme_use("clam")
+        style.configure("Custom.Treeview",
+                        background="#2a2a2a",
+                        foreground="#e6e6e6",
+                        fieldbackground="#2a2a2a",
+                        rowheight=26)
+        style.configure("Custom.Treeview.Heading",
+                        background="#2a2a2a",
+                        foreground="#ffffff")
+
+        DashboardApp._styles_configured = True
+
     def _build_ui(self):
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(1, weight=1)
@@ -316,9 +670,7 @@ class DashboardApp:
 
         ctk.CTkLabel(card, text="Algorithm").grid(row=1, column=0,
                                                   padx=10, pady=6, sticky="w")
-        self.algo_opt = ctk.CTkOptionMenu(card, values=[
-            "FCFS", "SJF", "Priority", "Round Robin"
-        ])
+        self.algo_opt = ctk.CTkOptionMenu(card, values=list(ALGORITHMS))
         self.algo_opt.grid(row=1, column=1, padx=10, pady=6)
         self.algo_opt.set("FCFS")
         self.algo_opt.configure(command=self._on_algo_change)
@@ -333,6 +685,10 @@ class DashboardApp:
                       fg_color="#1976d2", command=self.run_simulation)\
             .pack(fill="x", padx=12, pady=(8, 6))
 
+        ctk.CTkButton(self.sidebar, text="Compare All",
+                      fg_color="#6c5ce7", command=self.compare_all)\
+            .pack(fill="x", padx=12, pady=(0, 6))
+
         ctk.CTkButton(self.sidebar, text="Reset Output",
                       fg_color="#ff9800", command=self.reset_output)\
             .pack(fill="x", padx=12, pady=(0, 6))
@@ -406,17 +762,6 @@ class DashboardApp:
 
     def _make_treeview(self, parent, columns, height, assign_to=None):
         container = tk.Frame(parent, bg="#222")
-        style = ttk.Style()
-
-        style.theme_use("clam")
-        style.configure("Custom.Treeview",
-                        background="#2a2a2a",
-                        foreground="#e6e6e6",
-                        fieldbackground="#2a2a2a",
-                        rowheight=26)
-        style.configure("Custom.Treeview.Heading",
-                        background="#2a2a2a",
-                        foreground="#ffffff")
 
         tree = ttk.Treeview(container, columns=columns,
                             show="headings", height=height,
@@ -469,12 +814,16 @@ class DashboardApp:
             if arr_i < 0 or burst_i <= 0:
                 raise ValueError
 
+            if max(arr_i, burst_i, pr_i) > PROCESS_MAX or pr_i < PROCESS_MIN:
+                raise ValueError
+
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid numeric values.")
             return
 
         process = Process(pid, arr_i, burst_i, pr_i)
         self.processes.append(process)
+        self._processes_version += 1
 
         self.proc_tree.insert("", "end", values=(pid, arr_i, burst_i, pr_i))
 
@@ -485,51 +834,110 @@ class DashboardApp:
 
     def clear_processes(self):
         self.processes = []
-        for item in self.proc_tree.get_children():
-            self.proc_tree.delete(item)
-        for item in self.metrics_tree.get_children():
-            self.metrics_tree.delete(item)
+        self._processes_version += 1
+        self._run_token += 1
+        _run_cached.cache_clear()
+        self._color_cache = {"IDLE": "#555"}
+        self.proc_tree.delete(*self.proc_tree.get_children())
+        self.metrics_tree.delete(*self.metrics_tree.get_children())
 
         self.summary_label.configure(text="Summary:")
         self._clear_gantt()
 
     def reset_output(self):
-        for item in self.metrics_tree.get_children():
-            self.metrics_tree.delete(item)
+        self._run_token += 1
+        self.metrics_tree.delete(*self.metrics_tree.get_children())
         self.summary_label.configure(text="Summary:")
         self._clear_gantt()
 
+    def _sorted_processes(self):
+        """Arrival-sorted process list, re-sorted only after the list changes."""
+        version, ordered = self._sorted_cache
+        if version != self._processes_version:
+            ordered = sorted(self.processes, key=lambda p: p.arrival)
+            self._sorted_cache = (self._processes_version, ordered)
+        return ordered
+
     def _clear_gantt(self):
         self.ax.clear()
         self.ax.set_facecolor("#1b1b1b")
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def run_simulation(self):
+        if self._busy:
+            return
+
         algo = self.algo_opt.get()
         quantum = None
 
         if algo == "Round Robin":
-            qtxt = self.entry_quantum.get().strip()
-            if not qtxt:
-                messagebox.showerror("Missing Quantum", "Please enter a time quantum.")
+            quantum = self._parse_quantum(self.entry_quantum.get().strip())
+            if quantum is None:
                 return
 
-            try:
-                quantum = int(qtxt)
-                if quantum <= 0:
-                    raise ValueError
-            except ValueError:
-                messagebox.showerror("Invalid Quantum", "Quantum must be a positive integer.")
-                return
+        # Snapshot both orders so processes added mid-run do not leak in
+        processes = self._sorted_processes()
+        inputs = list(self.processes)
+
+        # Clear All and Reset Output bump the token so a run still in
+        # flight does not repaint the output they just cleared
+        self._run_token += 1
+
+        self._busy = True
+        threading.Thread(target=self._worker,
+                         args=(self._run_token, processes, inputs, algo, quantum),
+                         daemon=True).start()
+
+    def _parse_quantum(self, qtxt):
+        """Returns the quantum as a positive int, or None after an error dialog."""
+        if not qtxt:
+            messagebox.showerror("Missing Quantum", "Please enter a time quantum.")
+            return None
 
-        gantt, metrics, summary = run_scheduler(self.processes, algo, quantum)
+        try:
+            quantum = int(qtxt)
+            if quantum <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Invalid Quantum", "Quantum must be a positive integer.")
+            return None
+
+        return quantum
+
+    def _worker(self, token, processes, inputs, algo, quantum):
+        """Runs the scheduler off the Tk thread and hands results back to it."""
+        try:
+            gantt, metrics, summary = run_scheduler(processes, algo,
+                                                    quantum, presorted=True)
+        except Exception as exc:
+            self.root.after_idle(self._on_failure, exc)
+            return
+
+        self.root.after_idle(self._apply_results, token, processes, inputs,
+                             gantt, metrics, summary)
+
+    def _on_failure(self, exc):
+        self._busy = False
+        messagebox.showerror("Simulation Failed", str(exc))
+
+    def _apply_results(self, token, processes, inputs, gantt, metrics, summary):
+        self._busy = False
+
+        if token != self._run_token:
+            return
 
-        for item in self.metrics_tree.get_children():
-            self.metrics_tree.delete(item)
+        self.metrics_tree.delete(*self.metrics_tree.get_children())
 
-        for pid, m in metrics.items():
+        # Hide all columns while inserting so the tree lays out once at the end
+        self.metrics_tree.configure(displaycolumns=())
+
+        # Keep rows in input order; the scheduler saw the arrival-sorted list
+        for p in inputs:
+            m = metrics[p.pid]
             self.metrics_tree.insert("", "end",
-                                     values=(pid, m["CT"], m["TAT"], m["WT"], m["RT"]))
+                                     values=(p.pid, m["CT"], m["TAT"], m["WT"], m["RT"]))
+
+        self.metrics_tree.configure(displaycolumns="#all")
 
         self.summary_label.configure(
             text=f"Summary:  Avg WT={summary['avg_wt']:.2f} | "
@@ -538,49 +946,102 @@ class DashboardApp:
                  f"Total Time={summary['total_time']}"
         )
 
-        self._draw_gantt(gantt)
+        self._draw_gantt(gantt, processes)
+
+    def compare_all(self):
+        if self._busy:
+            return
+
+        if not self.processes:
+            messagebox.showwarning("No Processes", "Add at least one process first.")
+            return
+
+        # The quantum entry is disabled unless Round Robin is selected,
+        # so ask for one when it is empty
+        qtxt = self.entry_quantum.get().strip()
+        if not qtxt:
+            qtxt = ctk.CTkInputDialog(title="Time Quantum",
+                                      text="Time quantum for Round Robin:").get_input()
+            if qtxt is None:
+                return
+            qtxt = qtxt.strip()
+
+        quantum = self._parse_quantum(qtxt)
+        if quantum is None:
+            return
+
+        self._run_token += 1
+
+        self._busy = True
+        threading.Thread(target=self._compare_worker,
+                         args=(self._run_token, self._sorted_processes(), quantum),
+                         daemon=True).start()
 
-    def _draw_gantt(self, gantt):
+    def _compare_worker(self, token, processes, quantum):
+        """Runs every algorithm off the Tk thread and hands the results back."""
+        try:
+            results = run_all_scheduler(processes, quantum, presorted=True)
+        except Exception as exc:
+            self.root.after_idle(self._on_failure, exc)
+            return
+
+        self.root.after_idle(self._show_comparison, token, results)
+
+    def _show_comparison(self, token, results):
+        self._busy = False
+
+        if token != self._run_token:
+            return
+
+        lines = []
+        for algo in ALGORITHMS:
+            summary = results[algo][2]
+            lines.append(f"{algo}: Avg WT={summary['avg_wt']:.2f} | "
+                         f"Avg TAT={summary['avg_tat']:.2f} | "
+                         f"Throughput={summary['throughput']:.3f}")
+
+        messagebox.showinfo("Algorithm Comparison", "\n".join(lines))
+
+    def _draw_gantt(self, gantt, processes):
         self.ax.clear()
         self.ax.set_facecolor("#1b1b1b")
 
-        # Assign colors to processes
-        pids = [b["pid"] for b in gantt if b["pid"] != "IDLE"]
-        unique = list(dict.fromkeys(pids))
+        # One broken_barh artist per PID instead of one barh per block
+        bars = gantt_to_broken_barh(gantt)
+        names = {idx: "IDLE" if idx == IDLE_IDX else processes[idx].pid for idx in bars}
 
-        palette = [
-            "#00b894", "#0984e3", "#6c5ce7", "#e84393",
-            "#fdcb6e", "#e17055", "#00cec9", "#e056fd"
-        ]
-
-        colors = {pid: palette[i % len(palette)] for i, pid in enumerate(unique)}
+        # Assign colors to new processes; known PIDs keep theirs across runs.
+        # The cache is seeded with IDLE, so process slots start at len - 1.
+        palette = self._PALETTE
+        colors = self._color_cache
+        for pid in names.values():
+            if pid not in colors:
+                colors[pid] = palette[(len(colors) - 1) % len(palette)]
 
         y = 0.6
 
-        for block in gantt:
-            pid = block["pid"]
-            start, end = block["start"], block["end"]
-            width = end - start
-            color = "#555" if pid == "IDLE" else colors.get(pid, "#999")
-
-            self.ax.barh(y, width, left=start, height=0.6,
-                         color=color, edgecolor="white", linewidth=0.6)
+        for idx, segments in bars.items():
+            pid = names[idx]
+            self.ax.broken_barh(segments, (y - 0.3, 0.6), facecolors=colors[pid],
+                                edgecolor="white", linewidth=0.6)
 
-            if width >= 0.6:
-                self.ax.text(start + width / 2, y, pid,
+            labelled = [start + width / 2 for start, width in segments if width >= 0.6]
+            for x in labelled:
+                self.ax.text(x, y, pid,
                              ha="center", va="center",
                              fontsize=9, color="#0b0b0b", weight="bold")
 
-        total = gantt[-1]["end"] if gantt else 1
-        xticks = list(range(0, int(math.ceil(total)) + 1))
+        total = int(gantt["end"][-1]) if len(gantt) else 1
 
-        self.ax.set_xticks(xticks)
+        # A tick per time unit is unreadable and slow on long schedules
+        self.ax.xaxis.set_major_locator(MaxNLocator(nbins=20, integer=True))
+        self.ax.set_xlim(0, total)
         self.ax.set_yticks([])
         self.ax.tick_params(colors="#d0d0d0")
 
         self.ax.xaxis.grid(True, color="#2b2b2b")
 
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
 
 # ------------------------------------------------------------